@@ -1,8 +1,8 @@
 import sys
 import chess
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QMessageBox
-from PyQt5.QtCore import Qt, QRect, QPropertyAnimation, pyqtProperty, QEasingCurve, QPoint
-from PyQt5.QtGui import QPainter, QBrush, QPixmap, QColor, QPen, QFont, QPixmapCache
+from PyQt5.QtCore import Qt, QRect, QPropertyAnimation, pyqtProperty, QEasingCurve, QPoint, QPointF
+from PyQt5.QtGui import QPainter, QBrush, QPixmap, QColor, QPen, QFont, QPixmapCache, QPainterPath, QImage
 
 # Mapping from python-chess piece symbols to your PNG filenames.
 piece_images = {
@@ -21,6 +21,17 @@ piece_images = {
 }
 
 class ChessBoardWidget(QWidget):
+    # Paint-state objects built once at class definition, so paintEvent
+    # allocates no Qt objects per frame.
+    LIGHT = QColor("#FFFFFF")
+    DARK = QColor("#3f6bd1")
+    SELECT = QColor(173, 216, 230, 150)
+    CHECK = QColor(255, 200, 200, 150)
+    DOT = QColor(60, 60, 60, 100)
+    CAP_PEN = QPen(QColor(255, 0, 0, 150), 5, Qt.SolidLine)
+    COORD_FONT = QFont("Arial", 7)
+    COORD_FONT.setPointSize(6)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.square_size = 60
@@ -28,12 +39,48 @@ class ChessBoardWidget(QWidget):
         self.setFixedSize(self.board_size, self.board_size)
         # Enable keyboard focus so we can capture arrow keys.
         self.setFocusPolicy(Qt.StrongFocus)
-        
+
+        # Precomputed per-square geometry: (col, row, x, y, rect) for each
+        # square, so the paint path never calls chess.square_file/rank.
+        geom = []
+        for s in chess.SQUARES:
+            col = chess.square_file(s)
+            row = 7 - chess.square_rank(s)
+            x = col * self.square_size
+            y = row * self.square_size
+            geom.append((col, row, x, y,
+                         QRect(x, y, self.square_size, self.square_size)))
+        self._sq_geom = tuple(geom)
+
         # Initialize python-chess board.
         self.board = chess.Board()
         print("Initial board FEN:", self.board.fen())
         self.selected_square = None
         self.loadPieceImages()
+
+        # Per-square occupancy cache (piece and its pixmap index), rebuilt once
+        # per move so the paint loop indexes lists instead of calling piece_at.
+        self._occ = [None] * 64
+        self._occ_idx = [0] * 64
+        # Flat draw list of (square, rect, pixmap, piece) for occupied
+        # squares, so paintEvent iterates ready-made ops instead of probing
+        # all 64 squares.
+        self._piece_draw_ops = []
+        self._rebuildOccupancy()
+
+        # Cached legal moves from the selected square, so repaints during
+        # animations don't re-run the move generator every frame.
+        self._legal_cache_key = None
+        self._legal_from_selected = []
+        self._legal_targets = set()
+        self._killable_bb = 0
+        # Bounded memo of past results keyed on (transposition key, square),
+        # so scrubbing history back and forth re-hits old positions instead
+        # of regenerating their moves.
+        self._legal_memo = {}
+
+        # Static board squares and coordinates, baked once into a pixmap.
+        self._buildBoardBackground()
         
         # Move history: list of moves executed and current index.
         self.move_history = []
@@ -46,6 +93,10 @@ class ChessBoardWidget(QWidget):
         self.anim_start_point = (0, 0)
         self.anim_end_point = (0, 0)
         self.anim = None
+        # Last integer position of the animated piece, so repaints are only
+        # issued when it actually moves by a pixel.
+        self._last_anim_xy = (None, None)
+        self._last_anim_rect = QRect()
         
         # Bounce effects.
         self._bounce_scale = 1.0
@@ -53,11 +104,22 @@ class ChessBoardWidget(QWidget):
         self._king_bounce_scale = 1.0
         self.kingBounceAnim = None
 
+    @staticmethod
+    def _pieceIndex(piece):
+        """Pack (color, piece_type) into an index for the pixmap list."""
+        return piece.piece_type + (0 if piece.color else 6)
+
     def loadPieceImages(self):
         """Load and cache piece images for faster startup."""
-        self.piece_pixmaps = {}
+        # Scale once to the exact device pixel size so Qt never re-filters
+        # the pixmap at draw time on HiDPI screens.
+        dpr = self.devicePixelRatioF()
+        px = int(self.square_size * dpr)
+        # Pixmaps by packed (color, piece_type) index: white 1-6, black 7-12.
+        self._pm = [None] * 13
         for key, filename in piece_images.items():
-            cached_pixmap = QPixmapCache.find(filename)
+            cache_key = f"{filename}@{px}"
+            cached_pixmap = QPixmapCache.find(cache_key)
             if cached_pixmap is not None and not cached_pixmap.isNull():
                 pixmap = cached_pixmap
             else:
@@ -65,10 +127,80 @@ class ChessBoardWidget(QWidget):
                 if pixmap.isNull():
                     print(f"Failed to load {filename} for piece {key}")
                     continue
-                pixmap = pixmap.scaled(self.square_size, self.square_size,
+                pixmap = pixmap.scaled(px, px,
                                        Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                QPixmapCache.insert(filename, pixmap)
-            self.piece_pixmaps[key] = pixmap
+                pixmap.setDevicePixelRatio(dpr)
+                QPixmapCache.insert(cache_key, pixmap)
+            self._pm[self._pieceIndex(chess.Piece.from_symbol(key))] = pixmap
+
+        # Pre-scaled bounce frames (1.0x to 1.5x in 16 steps) per piece, so
+        # the bounce branches blit a cached pixmap instead of transforming
+        # the painter every frame.
+        self._scaled_pm = [None] * 13
+        for idx, base in enumerate(self._pm):
+            if base is None:
+                continue
+            frames = []
+            for step in range(16):
+                scale = 1.0 + 0.5 * step / 15
+                size = int(px * scale)
+                frame = base.scaled(size, size,
+                                    Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                frame.setDevicePixelRatio(dpr)
+                frames.append(frame)
+            self._scaled_pm[idx] = frames
+
+    def _bouncePixmap(self, index, scale):
+        """Return the cached pre-scaled pixmap nearest to the bounce scale."""
+        frames = self._scaled_pm[index]
+        if frames is None:
+            return None
+        step = int((scale - 1.0) / 0.5 * 15)
+        return frames[max(0, min(15, step))]
+
+    def _buildBoardBackground(self):
+        """Render the board squares and coordinate labels into a cached pixmap.
+
+        Composition happens in a QImage (fast CPU-side painting), which is
+        converted to a QPixmap once for fast blitting in paintEvent.
+        """
+        dpr = self.devicePixelRatioF()
+        image = QImage(int(self.board_size * dpr), int(self.board_size * dpr),
+                       QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+
+        for row in range(8):
+            for col in range(8):
+                rect = QRect(col * self.square_size, row * self.square_size,
+                             self.square_size, self.square_size)
+                color = self.LIGHT if (row + col) % 2 == 0 else self.DARK
+                painter.fillRect(rect, color)
+
+        # Board coordinates (very small letters on each square).
+        painter.setFont(self.COORD_FONT)
+        painter.setPen(QColor("black"))
+        # Files (a-h) in the bottom-right corner of each square on bottom row.
+        for col in range(8):
+            file_letter = "abcdefgh"[col]
+            x = col * self.square_size + self.square_size - 10
+            y = 7 * self.square_size + self.square_size - 2
+            painter.drawText(x, y, file_letter)
+        # Ranks (8-1) in the top-left corner of each square on leftmost column.
+        for row in range(8):
+            rank_number = str(8 - row)
+            x = 2
+            y = row * self.square_size + 10
+            painter.drawText(x, y, rank_number)
+        painter.end()
+
+        self._board_bg = QPixmap.fromImage(image)
+        self._board_bg.setDevicePixelRatio(dpr)
+
+    def _squareRect(self, square):
+        """Return the widget rect covering the given board square."""
+        return self._sq_geom[square][4]
 
     @pyqtProperty(float)
     def anim_progress(self):
@@ -77,7 +209,18 @@ class ChessBoardWidget(QWidget):
     @anim_progress.setter
     def anim_progress(self, value):
         self._anim_progress = value
-        self.update()
+        # Skip the frame entirely while the piece's integer position is
+        # unchanged; otherwise repaint just its previous and new rects.
+        start_x, start_y = self.anim_start_point
+        end_x, end_y = self.anim_end_point
+        current_x = int(start_x + (end_x - start_x) * value)
+        current_y = int(start_y + (end_y - start_y) * value)
+        if (current_x, current_y) == self._last_anim_xy:
+            return
+        self._last_anim_xy = (current_x, current_y)
+        rect = QRect(current_x, current_y, self.square_size, self.square_size)
+        self.update(rect.united(self._last_anim_rect))
+        self._last_anim_rect = rect
 
     @pyqtProperty(float)
     def bounceScale(self):
@@ -86,7 +229,13 @@ class ChessBoardWidget(QWidget):
     @bounceScale.setter
     def bounceScale(self, value):
         self._bounce_scale = value
-        self.update()
+        if self.selected_square is not None:
+            # The bounce scales up to 1.5x, so pad the rect for the overflow.
+            margin = self.square_size // 4
+            self.update(self._squareRect(self.selected_square).adjusted(
+                -margin, -margin, margin, margin))
+        else:
+            self.update()
 
     @pyqtProperty(float)
     def kingBounceScale(self):
@@ -95,175 +244,207 @@ class ChessBoardWidget(QWidget):
     @kingBounceScale.setter
     def kingBounceScale(self, value):
         self._king_bounce_scale = value
-        self.update()
+        king_sq = self.board.king(self.board.turn)
+        if king_sq is not None:
+            margin = self.square_size // 4
+            self.update(self._squareRect(king_sq).adjusted(
+                -margin, -margin, margin, margin))
+        else:
+            self.update()
+
+    def _rebuildOccupancy(self):
+        """Refresh the per-square piece caches and the piece draw list.
+
+        Works directly on the raw piece bitboards: one lowest-set-bit walk
+        over the twelve masks replaces 64 piece_at lookups, and empty
+        squares are never touched.
+        """
+        occ = self._occ
+        occ_idx = self._occ_idx
+        for square in range(64):
+            occ[square] = None
+            occ_idx[square] = 0
+        ops = []
+        for color in (chess.WHITE, chess.BLACK):
+            for piece_type in chess.PIECE_TYPES:
+                piece = chess.Piece(piece_type, color)
+                index = self._pieceIndex(piece)
+                pixmap = self._pm[index]
+                bb = self.board.pieces_mask(piece_type, color)
+                while bb:
+                    square = (bb & -bb).bit_length() - 1
+                    bb &= bb - 1
+                    occ[square] = piece
+                    occ_idx[square] = index
+                    if pixmap is None:
+                        print(f"No pixmap for piece {piece.symbol()} at square {square}")
+                        continue
+                    ops.append((square, self._sq_geom[square][4], pixmap, piece))
+        ops.sort(key=lambda op: op[0])
+        self._piece_draw_ops = ops
+
+    def legalMovesFromSelected(self):
+        """Return the legal moves from the selected square, cached per board state.
+
+        A single pass over the moves also partitions the destinations into
+        plain targets and capture (killable) squares so paintEvent never
+        re-walks the list or re-queries is_capture/is_en_passant.
+        """
+        key = (self.board._transposition_key(), self.selected_square)
+        if key != self._legal_cache_key:
+            self._legal_cache_key = key
+            cached = self._legal_memo.get(key)
+            if cached is None:
+                moves = [
+                    move for move in self.board.legal_moves
+                    if move.from_square == self.selected_square
+                ]
+                targets = set()
+                # Capture squares as a 64-bit mask: OR-ing bits dedups
+                # promotion variants without any set hashing.
+                killable = 0
+                for move in moves:
+                    if self.board.is_capture(move):
+                        if self.board.is_en_passant(move):
+                            if self._occ[move.from_square].color == chess.WHITE:
+                                killable |= 1 << (move.to_square - 8)
+                            else:
+                                killable |= 1 << (move.to_square + 8)
+                        else:
+                            killable |= 1 << move.to_square
+                    else:
+                        targets.add(move.to_square)
+                # Evict the oldest entry once the memo fills up.
+                if len(self._legal_memo) >= 512:
+                    del self._legal_memo[next(iter(self._legal_memo))]
+                cached = (moves, targets, killable)
+                self._legal_memo[key] = cached
+            self._legal_from_selected, self._legal_targets, self._killable_bb = cached
+        return self._legal_from_selected
 
     def resetBoardToIndex(self):
-        """Reset the board to the starting position and push moves up to current_move_index."""
+        """Reset the board to the starting position and push moves up to current_move_index.
+
+        Fallback for arbitrary jumps; single steps use stepBack/stepForward.
+        """
         self.board.reset()
         for move in self.move_history[:self.current_move_index]:
             self.board.push(move)
+        self._rebuildOccupancy()
+        self._legal_cache_key = None
+        self._syncKingBounce()
+        self.update()
+
+    def stepBack(self):
+        """Undo the last move in place instead of replaying from move one."""
+        self.board.pop()
+        self.current_move_index -= 1
+        self._rebuildOccupancy()
+        self._legal_cache_key = None
+        self._syncKingBounce()
+        self.update()
+
+    def stepForward(self):
+        """Redo the next move from the history in place."""
+        self.board.push(self.move_history[self.current_move_index])
+        self.current_move_index += 1
+        self._rebuildOccupancy()
+        self._legal_cache_key = None
+        self._syncKingBounce()
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        # Set a very small font for board coordinates.
-        coord_font = QFont("Arial", 7)
-        painter.setFont(coord_font)
 
-        light_color = QColor("#FFFFFF")
-        dark_color = QColor("#3f6bd1")
-        select_color = QColor(173, 216, 230, 150)
+        # Blit the pre-rendered squares and coordinates in one call; the
+        # painter is already clipped to the exposed region.
+        painter.drawPixmap(0, 0, self._board_bg)
 
-        # Draw board squares.
-        for row in range(8):
-            for col in range(8):
-                rect = QRect(col * self.square_size, row * self.square_size,
-                             self.square_size, self.square_size)
-                color = light_color if (row + col) % 2 == 0 else dark_color
-                painter.fillRect(rect, color)
+        # Compute check state once per paint instead of per piece below.
+        in_check = self.board.is_check()
+        check_king_sq = self.board.king(self.board.turn) if in_check else None
 
         # Highlight king's square in light red if in check.
-        if self.board.is_check():
-            king_sq = self.board.king(self.board.turn)
-            if king_sq is not None:
-                king_col = chess.square_file(king_sq)
-                king_row = 7 - chess.square_rank(king_sq)
-                king_rect = QRect(king_col * self.square_size, king_row * self.square_size,
-                                  self.square_size, self.square_size)
-                painter.fillRect(king_rect, QColor(255, 200, 200, 150))
+        if check_king_sq is not None:
+            painter.fillRect(self._sq_geom[check_king_sq][4], self.CHECK)
 
         # Highlight selected square.
         if self.selected_square is not None:
-            col = chess.square_file(self.selected_square)
-            row = 7 - chess.square_rank(self.selected_square)
-            sel_rect = QRect(col * self.square_size, row * self.square_size,
-                             self.square_size, self.square_size)
-            painter.fillRect(sel_rect, select_color)
+            painter.fillRect(self._sq_geom[self.selected_square][4], self.SELECT)
 
-        # Highlight legal (non-capture) moves.
+        # Highlight legal (non-capture) moves and capture targets; the
+        # destinations were partitioned in one pass when the cache was built.
         if self.selected_square is not None and not self.animating:
-            for move in self.board.legal_moves:
-                if move.from_square == self.selected_square and not self.board.is_capture(move):
-                    dest_sq = move.to_square
-                    dest_col = chess.square_file(dest_sq)
-                    dest_row = 7 - chess.square_rank(dest_sq)
-                    legal_rect = QRect(dest_col * self.square_size, dest_row * self.square_size,
-                                       self.square_size, self.square_size)
-                    painter.setBrush(QColor(60, 60, 60, 100))
-                    painter.setPen(Qt.NoPen)
-                    center = legal_rect.center()
-                    radius = self.square_size // 4.5
-                    painter.drawEllipse(center, radius, radius)
-
-        # Highlight capture targets with a transparent red hollow circle.
-        if self.selected_square is not None and not self.animating:
-            killable_squares = set()
-            for move in self.board.legal_moves:
-                if move.from_square == self.selected_square and self.board.is_capture(move):
-                    if self.board.is_en_passant(move):
-                        piece = self.board.piece_at(move.from_square)
-                        if piece and piece.color == chess.WHITE:
-                            captured_sq = move.to_square - 8
-                        else:
-                            captured_sq = move.to_square + 8
-                    else:
-                        captured_sq = move.to_square
-                    killable_squares.add(captured_sq)
-            pen = QPen(QColor(255, 0, 0, 150), 5, Qt.SolidLine)
-            painter.setPen(pen)
+            self.legalMovesFromSelected()
+            # Accumulate all circles into two paths so each group is a
+            # single painter call instead of one drawEllipse per square.
+            dots_path = QPainterPath()
+            radius = self.square_size // 4.5
+            for sq in self._legal_targets:
+                center = self._sq_geom[sq][4].center()
+                dots_path.addEllipse(QPointF(center), radius, radius)
+            painter.setBrush(self.DOT)
+            painter.setPen(Qt.NoPen)
+            painter.drawPath(dots_path)
+            caps_path = QPainterPath()
+            radius = self.square_size // 2 - 5
+            bb = self._killable_bb
+            while bb:
+                sq = (bb & -bb).bit_length() - 1
+                bb &= bb - 1
+                center = self._sq_geom[sq][4].center()
+                caps_path.addEllipse(QPointF(center), radius, radius)
+            painter.setPen(self.CAP_PEN)
             painter.setBrush(Qt.NoBrush)
-            for sq in killable_squares:
-                col = chess.square_file(sq)
-                row = 7 - chess.square_rank(sq)
-                center = QPoint(col * self.square_size + self.square_size // 2,
-                                row * self.square_size + self.square_size // 2)
-                radius = self.square_size // 2 - 5
-                painter.drawEllipse(center, radius, radius)
-
-        # Draw pieces.
-        for square in chess.SQUARES:
-            piece = self.board.piece_at(square)
-            if piece:
-                if self.animating and self.pending_move:
-                    if square == self.pending_move.from_square:
-                        continue
-                    if square == self.pending_move.to_square and self.board.piece_at(square) is not None:
-                        if self.board.piece_at(square).color != self.board.turn:
-                            continue
-                symbol = piece.symbol()
-                pixmap = self.piece_pixmaps.get(symbol)
-                if pixmap:
-                    col = chess.square_file(square)
-                    row = 7 - chess.square_rank(square)
-                    target_rect = QRect(col * self.square_size, row * self.square_size,
-                                        self.square_size, self.square_size)
-                    # Bounce the king if in check.
-                    if piece.piece_type == chess.KING and piece.color == self.board.turn and self.board.is_check():
-                        if self.kingBounceAnim is None:
-                            self.startKingBounce()
-                        painter.save()
-                        center = target_rect.center()
-                        painter.translate(center)
-                        painter.scale(self.kingBounceScale, self.kingBounceScale)
-                        painter.translate(-center)
-                        painter.drawPixmap(target_rect, pixmap)
-                        painter.restore()
-                    # Bounce effect for selected piece.
-                    elif square == self.selected_square and not self.animating:
-                        painter.save()
-                        center = target_rect.center()
-                        painter.translate(center)
-                        painter.scale(self.bounceScale, self.bounceScale)
-                        painter.translate(-center)
-                        painter.drawPixmap(target_rect, pixmap)
-                        painter.restore()
-                    else:
-                        painter.drawPixmap(target_rect, pixmap)
-                else:
-                    print(f"No pixmap for piece {symbol} at square {square}")
+            painter.drawPath(caps_path)
+
+        # Draw pieces from the precomputed draw list (occupied squares only).
+        pending = self.pending_move if self.animating else None
+        for square, target_rect, pixmap, piece in self._piece_draw_ops:
+            if pending is not None:
+                if square == pending.from_square:
+                    continue
+                if square == pending.to_square and piece.color != self.board.turn:
+                    continue
+            # Bounce the king if in check.
+            if square == check_king_sq:
+                bounced = self._bouncePixmap(self._occ_idx[square],
+                                             self.kingBounceScale)
+                half = int(bounced.width() / bounced.devicePixelRatio()) // 2
+                painter.drawPixmap(target_rect.center() - QPoint(half, half),
+                                   bounced)
+            # Bounce effect for selected piece.
+            elif square == self.selected_square and not self.animating:
+                bounced = self._bouncePixmap(self._occ_idx[square],
+                                             self.bounceScale)
+                half = int(bounced.width() / bounced.devicePixelRatio()) // 2
+                painter.drawPixmap(target_rect.center() - QPoint(half, half),
+                                   bounced)
+            else:
+                # Point form: the pixmap is pre-scaled to the square size, so
+                # skip Qt's rect-vs-pixmap size check entirely.
+                painter.drawPixmap(target_rect.topLeft(), pixmap)
 
         # Draw moving piece animation.
         if self.animating and self.pending_move:
-            piece = self.board.piece_at(self.pending_move.from_square)
+            piece = self._occ[self.pending_move.from_square]
             if piece:
-                symbol = piece.symbol()
-                pixmap = self.piece_pixmaps.get(symbol)
+                pixmap = self._pm[self._occ_idx[self.pending_move.from_square]]
                 if pixmap:
                     start_x, start_y = self.anim_start_point
                     end_x, end_y = self.anim_end_point
                     current_x = start_x + (end_x - start_x) * self._anim_progress
                     current_y = start_y + (end_y - start_y) * self._anim_progress
-                    target_rect = QRect(int(current_x), int(current_y),
-                                        self.square_size, self.square_size)
-                    painter.drawPixmap(target_rect, pixmap)
-
-        # Draw board coordinates (very small letters on each square).
-        painter.setPen(QColor("black"))
-        coord_font.setPointSize(6)
-        painter.setFont(coord_font)
-        # Files (a-h) in the bottom-right corner of each square on bottom row.
-        for col in range(8):
-            file_letter = "abcdefgh"[col]
-            x = col * self.square_size + self.square_size - 10
-            y = 7 * self.square_size + self.square_size - 2
-            painter.drawText(x, y, file_letter)
-        # Ranks (8-1) in the top-left corner of each square on leftmost column.
-        for row in range(8):
-            rank_number = str(8 - row)
-            x = 2
-            y = row * self.square_size + 10
-            painter.drawText(x, y, rank_number)
+                    painter.drawPixmap(QPoint(int(current_x), int(current_y)), pixmap)
 
     def keyPressEvent(self, event):
         # Use arrow keys to navigate game history (undo/redo moves).
         if event.key() == Qt.Key_Left:
             if self.current_move_index > 0:
-                self.current_move_index -= 1
-                self.resetBoardToIndex()
+                self.stepBack()
         elif event.key() == Qt.Key_Right:
             if self.current_move_index < len(self.move_history):
-                self.current_move_index += 1
-                self.resetBoardToIndex()
+                self.stepForward()
         else:
             super().keyPressEvent(event)
 
@@ -284,7 +465,9 @@ class ChessBoardWidget(QWidget):
             if (self.board.piece_at(self.selected_square).piece_type == chess.PAWN and
                 (chess.square_rank(square) == 0 or chess.square_rank(square) == 7)):
                 move = chess.Move(self.selected_square, square, promotion=chess.QUEEN)
-            if move in self.board.legal_moves:
+            # Test just this move for legality instead of scanning the full
+            # legal-move list for containment.
+            if self.board.is_legal(move):
                 self.startAnimation(move)
             self.selected_square = None
             self.update()
@@ -314,18 +497,27 @@ class ChessBoardWidget(QWidget):
             self.kingBounceAnim = None
             self._king_bounce_scale = 1.0
 
+    def _syncKingBounce(self):
+        """Start or stop the king bounce to match the current check state.
+
+        Called whenever the board changes, keeping the animation setup out
+        of the paintEvent hot path.
+        """
+        if self.board.is_check():
+            if self.kingBounceAnim is None:
+                self.startKingBounce()
+        else:
+            self.stopKingBounce()
+
     def startAnimation(self, move):
         self.pending_move = move
-        source_square = move.from_square
-        dest_square = move.to_square
-        source_col = chess.square_file(source_square)
-        source_row = 7 - chess.square_rank(source_square)
-        dest_col = chess.square_file(dest_square)
-        dest_row = 7 - chess.square_rank(dest_square)
-        self.anim_start_point = (source_col * self.square_size, source_row * self.square_size)
-        self.anim_end_point = (dest_col * self.square_size, dest_row * self.square_size)
+        self.anim_start_point = self._sq_geom[move.from_square][2:4]
+        self.anim_end_point = self._sq_geom[move.to_square][2:4]
         self.animating = True
         self._anim_progress = 0.0
+        self._last_anim_xy = (None, None)
+        self._last_anim_rect = QRect(self.anim_start_point[0], self.anim_start_point[1],
+                                     self.square_size, self.square_size)
         self.anim = QPropertyAnimation(self, b"anim_progress")
         self.anim.setDuration(150)
         self.anim.setStartValue(0.0)
@@ -342,8 +534,9 @@ class ChessBoardWidget(QWidget):
         self.current_move_index = len(self.move_history)
         self.pending_move = None
         self.animating = False
-        if not self.board.is_check():
-            self.stopKingBounce()
+        self._rebuildOccupancy()
+        self._legal_cache_key = None
+        self._syncKingBounce()
         self.update()
         self.checkGameStatus()
 